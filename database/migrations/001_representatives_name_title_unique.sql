@@ -0,0 +1,51 @@
+-- Add the (name, title) uniqueness constraint used by the scrapers' ON CONFLICT upserts
+-- Run against databases created before the constraint was added to schema.sql
+
+BEGIN;
+
+-- Pair each duplicate representative with the row that survives: the most recently
+-- updated one (NULL timestamps last), then the highest id
+CREATE TEMP TABLE representative_duplicates ON COMMIT DROP AS
+SELECT id, keep_id
+FROM (
+    SELECT id,
+           first_value(id) OVER (
+               PARTITION BY name, title
+               ORDER BY updated_at DESC NULLS LAST, id DESC
+           ) AS keep_id
+    FROM representatives
+) ranked
+WHERE id <> keep_id;
+
+-- Drop mappings that would collide once moved: keep one per (survivor, geography),
+-- preferring the survivor's own mapping
+DELETE FROM rep_geography_map
+WHERE id IN (
+    SELECT id
+    FROM (
+        SELECT m.id,
+               row_number() OVER (
+                   PARTITION BY COALESCE(d.keep_id, m.representative_id), m.geography_id
+                   ORDER BY (d.keep_id IS NOT NULL), m.id
+               ) AS rn
+        FROM rep_geography_map m
+        LEFT JOIN representative_duplicates d ON d.id = m.representative_id
+    ) ranked
+    WHERE rn > 1
+);
+
+-- Move the duplicates' remaining ZIP mappings to the surviving row
+UPDATE rep_geography_map m
+SET representative_id = d.keep_id
+FROM representative_duplicates d
+WHERE m.representative_id = d.id;
+
+-- The duplicates no longer have mappings, so the cascade removes nothing
+DELETE FROM representatives r
+USING representative_duplicates d
+WHERE r.id = d.id;
+
+ALTER TABLE representatives
+    ADD CONSTRAINT representatives_name_title_key UNIQUE (name, title);
+
+COMMIT;
@@ -0,0 +1,12 @@
+-- Unlogged staging table used by the scrapers' COPY-based geography bulk loader
+
+CREATE UNLOGGED TABLE IF NOT EXISTS geography_staging (
+    zip_code TEXT,
+    city TEXT,
+    state TEXT,
+    state_name TEXT,
+    county TEXT,
+    congressional_district TEXT,
+    latitude TEXT,
+    longitude TEXT
+);
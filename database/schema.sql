@@ -3,6 +3,7 @@
 DROP TABLE IF EXISTS rep_geography_map CASCADE;
 DROP TABLE IF EXISTS representatives CASCADE;
 DROP TABLE IF EXISTS geography CASCADE;
+DROP TABLE IF EXISTS geography_staging;
 
 -- Create geography table for ZIP code and location data
 CREATE TABLE geography (
@@ -19,6 +20,18 @@ CREATE TABLE geography (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Unlogged staging table for bulk COPY loads of geography data
+CREATE UNLOGGED TABLE geography_staging (
+    zip_code TEXT,
+    city TEXT,
+    state TEXT,
+    state_name TEXT,
+    county TEXT,
+    congressional_district TEXT,
+    latitude TEXT,
+    longitude TEXT
+);
+
 -- Create representatives table for political representatives
 CREATE TABLE representatives (
     id SERIAL PRIMARY KEY,
@@ -40,7 +53,8 @@ CREATE TABLE representatives (
     term_end DATE,
     is_active BOOLEAN DEFAULT true,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(name, title)
 );
 
 -- Create mapping table between geography and representatives
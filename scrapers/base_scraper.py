@@ -1,28 +1,217 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import httpx
+import asyncio
+from bs4 import BeautifulSoup, SoupStrainer
 import psycopg2
 import psycopg2.extras
+from psycopg2.extras import execute_values
 import os
+import re
 import time
 import logging
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from fake_useragent import UserAgent
-from retrying import retry
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception
 from dotenv import load_dotenv
+import db_pool
+from queries import (
+    INSERT_GEOGRAPHY_SQL, UPSERT_GEOGRAPHIES_SQL, UPSERT_GEOGRAPHIES_TEMPLATE, TRUNCATE_GEOGRAPHY_STAGING_SQL,
+    COPY_GEOGRAPHY_STAGING_SQL, MERGE_GEOGRAPHY_STAGING_SQL, UPSERT_REPRESENTATIVE_SQL,
+    UPSERT_REPRESENTATIVES_SQL, INSERT_GEOGRAPHY_MAPPING_SQL, INSERT_GEOGRAPHY_MAPPINGS_SQL
+)
+import threading
 import json
-from typing import List, Dict, Optional, Tuple
+import csv
+import io
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Optional, Tuple, Iterable, Union, Mapping
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
+# Configure logging: callers only enqueue records; a background listener
+# thread owns the (rotating) file and stream handlers
+_log_queue = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('scraper.log'),
-        logging.StreamHandler()
+        QueueHandler(_log_queue)
     ]
 )
+_log_listener = QueueListener(
+    _log_queue,
+    RotatingFileHandler('scraper.log', maxBytes=50_000_000, backupCount=5),
+    logging.StreamHandler()
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Column order shared by the geography CSV loader and the staging table
+GEOGRAPHY_COLUMNS = (
+    'zip_code', 'city', 'state', 'state_name', 'county',
+    'congressional_district', 'latitude', 'longitude'
+)
+
+# Column order shared by RepBatch and the representative upsert statement (checked below RepBatch)
+REPRESENTATIVE_COLUMNS = (
+    'name', 'title', 'party', 'branch', 'office_type', 'phone', 'email',
+    'website', 'photo_url', 'address_line1', 'address_line2',
+    'address_city', 'address_state', 'address_zip', 'term_start',
+    'term_end', 'is_active'
+)
+
+@dataclass
+class RepBatch:
+    """Column-oriented buffer of representatives; each field holds one column's values"""
+    name: List[str] = field(default_factory=list)
+    title: List[str] = field(default_factory=list)
+    party: List[Optional[str]] = field(default_factory=list)
+    branch: List[str] = field(default_factory=list)
+    office_type: List[Optional[str]] = field(default_factory=list)
+    phone: List[Optional[str]] = field(default_factory=list)
+    email: List[Optional[str]] = field(default_factory=list)
+    website: List[Optional[str]] = field(default_factory=list)
+    photo_url: List[Optional[str]] = field(default_factory=list)
+    address_line1: List[Optional[str]] = field(default_factory=list)
+    address_line2: List[Optional[str]] = field(default_factory=list)
+    address_city: List[Optional[str]] = field(default_factory=list)
+    address_state: List[Optional[str]] = field(default_factory=list)
+    address_zip: List[Optional[str]] = field(default_factory=list)
+    term_start: List = field(default_factory=list)
+    term_end: List = field(default_factory=list)
+    is_active: List[bool] = field(default_factory=list)
+    
+    @classmethod
+    def from_reps(cls, reps: Iterable[Mapping]) -> 'RepBatch':
+        """Build a batch from representative dicts"""
+        batch = cls()
+        for rep in reps:
+            batch.add(rep)
+        return batch
+    
+    def __len__(self) -> int:
+        return len(self.name)
+    
+    def columns(self) -> Tuple[List, ...]:
+        """Column lists in REPRESENTATIVE_COLUMNS order"""
+        return tuple(getattr(self, f.name) for f in fields(self))
+    
+    def add(self, rep: Mapping):
+        """Append one representative's values to each column"""
+        for column, values in zip(REPRESENTATIVE_COLUMNS, self.columns()):
+            values.append(rep.get(column))
+    
+    def flush(self, cursor) -> List[int]:
+        """Upsert the buffered rows in one statement, clear the batch, and return IDs in row order"""
+        # A statement may not touch the same conflict row twice; the last row wins
+        rows = dict(zip(zip(self.name, self.title), zip(*self.columns()))).values()
+        returned = execute_values(
+            cursor, UPSERT_REPRESENTATIVES_SQL, rows, page_size=500, fetch=True
+        )
+        
+        # RETURNING order is not guaranteed, so map IDs back by the conflict key
+        ids_by_key = {(name, title): rep_id for rep_id, name, title in returned}
+        rep_ids = [ids_by_key[key] for key in zip(self.name, self.title)]
+        
+        for values in self.columns():
+            values.clear()
+        
+        return rep_ids
+
+# RepBatch.columns() feeds the upsert positionally, so its fields must follow REPRESENTATIVE_COLUMNS
+if tuple(f.name for f in fields(RepBatch)) != REPRESENTATIVE_COLUMNS:
+    raise TypeError("RepBatch fields must match REPRESENTATIVE_COLUMNS")
+
+# User agents sampled per scraper; the env default is used if fake_useragent fails
+UA_POOL_SIZE = 32
+DEFAULT_USER_AGENT = os.getenv(
+    'SCRAPER_USER_AGENT',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+)
+
+# Upper bound on bytes read from a single response body
+MAX_RESPONSE_BYTES = int(os.getenv('SCRAPER_MAX_RESPONSE_BYTES', str(5 * 1024 * 1024)))
+
+# Hosts and keep-alive connections per host kept open by each session
+HTTP_POOL_SIZE = 20
+
+# Seconds before a connect or read stalls out; Session has no default timeout of its own
+REQUEST_TIMEOUT = 30
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry transport failures and 5xx responses; 4xx errors fail immediately"""
+    if isinstance(exc, requests.HTTPError):
+        return exc.response is not None and exc.response.status_code >= 500
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout, httpx.TransportError))
+
+def _log_retry(retry_state):
+    """Log each retry on the scraper's own logger"""
+    scraper = retry_state.args[0]
+    url = retry_state.args[1] if len(retry_state.args) > 1 else retry_state.kwargs.get('url')
+    scraper.logger.warning(
+        f"Retrying {url} in {retry_state.next_action.sleep:.2f}s "
+        f"(attempt {retry_state.attempt_number}): {retry_state.outcome.exception()}"
+    )
+
+# Exponential backoff with jitter so concurrent workers do not retry in lockstep
+_request_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=0.25, max=8),
+    retry=retry_if_exception(_is_retryable),
+    before_sleep=_log_retry,
+    reraise=True
+)
+
+def default_request_delay() -> float:
+    """Seconds to wait between requests, from SCRAPER_DELAY_MS"""
+    return float(os.getenv('SCRAPER_DELAY_MS', '2000')) / 1000
+
+class TokenBucket:
+    """Thread-safe token bucket for pacing requests across concurrent workers"""
+    
+    def __init__(self, rate_per_sec: float, burst: int = 1):
+        self.rate = rate_per_sec
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _take(self) -> float:
+        """Take a token if one is available, else return seconds until the next"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            
+            return (1 - self.tokens) / self.rate
+    
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        wait = self._take()
+        while wait:
+            time.sleep(wait)
+            wait = self._take()
+    
+    async def acquire_async(self):
+        """Async variant of acquire that yields to other tasks while waiting"""
+        wait = self._take()
+        while wait:
+            await asyncio.sleep(wait)
+            wait = self._take()
+
+# Precompiled patterns for the text extraction helpers
+_PHONE_RE = re.compile(r'(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
 
 class BaseScraper:
     """Base class for web scraping government representative data"""
@@ -30,47 +219,74 @@ class BaseScraper:
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.user_agent = UserAgent()
-        self.session = requests.Session()
+        self._local = threading.local()
+        self._aclient = None
+        self._owns_aclient = False
+        # Optional TokenBucket taken before every outgoing request, retries included
+        self.rate_limiter = None
         self.db_connection = None
+        self._cursor = None
         self.setup_session()
         self.connect_database()
         
     def setup_session(self):
         """Configure requests session with headers and timeouts"""
-        self.session.headers.update({
-            'User-Agent': self.user_agent.random,
+        # Sample user agents once up front so rotation is a cheap index per request
+        try:
+            self._ua_pool = tuple(self.user_agent.random for _ in range(UA_POOL_SIZE))
+        except Exception as e:
+            self.logger.warning(f"Falling back to default user agent: {e}")
+            self._ua_pool = (DEFAULT_USER_AGENT,)
+        self._ua_idx = 0
+        
+        self._session_headers = {
+            'User-Agent': self._ua_pool[0],
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
-        })
-        
-        # Set timeout for all requests
-        self.session.timeout = 30
+        }
+    
+    @property
+    def session(self) -> requests.Session:
+        """Per-thread requests session (Sessions are not thread-safe)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers.update(self._session_headers)
+            
+            # Keep connections alive across ZIP codes instead of reconnecting per request
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        return session
         
     def connect_database(self):
-        """Establish database connection"""
+        """Borrow a database connection from the shared pool"""
         try:
-            self.db_connection = psycopg2.connect(
-                host=os.getenv('DB_HOST', 'localhost'),
-                database=os.getenv('DB_NAME', 'political_reps_db'),
-                user=os.getenv('DB_USER', 'postgres'),
-                password=os.getenv('DB_PASSWORD'),
-                port=os.getenv('DB_PORT', '5432')
-            )
+            self.db_connection = db_pool.getconn()
             self.db_connection.autocommit = False
+            # One cursor per scraper, reused by every helper; it survives rollbacks
+            self._cursor = self.db_connection.cursor()
             self.logger.info("Database connection established")
         except Exception as e:
             self.logger.error(f"Database connection failed: {e}")
             raise
     
-    @retry(stop_max_attempt_number=3, wait_fixed=2000)
+    @_request_retry
     def make_request(self, url: str, method: str = 'GET', **kwargs) -> requests.Response:
         """Make HTTP request with retry logic"""
         try:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            
             # Rotate user agent for each request
-            self.session.headers['User-Agent'] = self.user_agent.random
+            self.session.headers['User-Agent'] = self.next_user_agent()
+            
+            # Stream bodies so callers can cap how much they read with read_body
+            kwargs.setdefault('stream', True)
+            kwargs.setdefault('timeout', REQUEST_TIMEOUT)
             
             if method.upper() == 'GET':
                 response = self.session.get(url, **kwargs)
@@ -79,16 +295,80 @@ class BaseScraper:
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
-            response.raise_for_status()
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError:
+                # Streamed responses hold their pooled connection until closed
+                response.close()
+                raise
             return response
             
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Request failed for {url}: {e}")
             raise
     
-    def parse_html(self, html_content: str, parser: str = 'html.parser') -> BeautifulSoup:
-        """Parse HTML content with BeautifulSoup"""
-        return BeautifulSoup(html_content, parser)
+    def read_body(self, response: requests.Response, max_bytes: int = MAX_RESPONSE_BYTES) -> bytes:
+        """Read a streamed response body, truncated to max_bytes"""
+        try:
+            response.raw.decode_content = True
+            body = response.raw.read(max_bytes + 1)
+        finally:
+            response.close()
+        
+        if len(body) > max_bytes:
+            self.logger.warning(f"Response from {response.url} truncated to {max_bytes} bytes")
+            body = body[:max_bytes]
+        
+        return body
+    
+    def next_user_agent(self) -> str:
+        """Return the next user agent from the pool (round-robin)"""
+        user_agent = self._ua_pool[self._ua_idx % len(self._ua_pool)]
+        self._ua_idx += 1
+        return user_agent
+    
+    def _async_client(self) -> httpx.AsyncClient:
+        """Shared async client, created on first use unless one was injected"""
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                timeout=REQUEST_TIMEOUT,
+                http2=True,
+                headers=self._session_headers,
+                follow_redirects=True
+            )
+            self._owns_aclient = True
+        return self._aclient
+    
+    @_request_retry
+    async def fetch_body_async(self, url: str, method: str = 'GET',
+                               max_bytes: int = MAX_RESPONSE_BYTES, **kwargs) -> bytes:
+        """Make an async request and stream its body, truncated to max_bytes"""
+        try:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async()
+            
+            headers = {**self._session_headers, 'User-Agent': self.next_user_agent()}
+            async with self._async_client().stream(method.upper(), url, headers=headers, **kwargs) as response:
+                response.raise_for_status()
+                
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                    if len(body) > max_bytes:
+                        self.logger.warning(f"Response from {url} truncated to {max_bytes} bytes")
+                        del body[max_bytes:]
+                        break
+                
+                return bytes(body)
+            
+        except httpx.HTTPError as e:
+            self.logger.error(f"Async request failed for {url}: {e}")
+            raise
+    
+    def parse_html(self, html_content: str, parser: str = 'lxml',
+                   parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse HTML content with BeautifulSoup, optionally keeping only matching tags"""
+        return BeautifulSoup(html_content, parser, parse_only=parse_only)
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text data"""
@@ -101,170 +381,201 @@ class BaseScraper:
     
     def extract_phone(self, text: str) -> Optional[str]:
         """Extract phone number from text"""
-        import re
         if not text:
             return None
             
         # Pattern for US phone numbers
-        phone_pattern = r'(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
-        match = re.search(phone_pattern, text)
+        match = _PHONE_RE.search(text)
         return match.group(1) if match else None
     
     def extract_email(self, text: str) -> Optional[str]:
         """Extract email address from text"""
-        import re
         if not text:
             return None
             
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        match = re.search(email_pattern, text)
+        match = _EMAIL_RE.search(text)
         return match.group(0) if match else None
     
     def insert_geography(self, geography_data: Dict) -> int:
         """Insert geography data and return ID"""
-        cursor = self.db_connection.cursor()
+        cursor = self._cursor
         
         try:
-            insert_query = """
-                INSERT INTO geography (
-                    zip_code, city, state, state_name, county, 
-                    congressional_district, latitude, longitude
-                ) VALUES (
-                    %(zip_code)s, %(city)s, %(state)s, %(state_name)s, 
-                    %(county)s, %(congressional_district)s, %(latitude)s, %(longitude)s
-                )
-                ON CONFLICT (zip_code) DO UPDATE SET
-                    city = EXCLUDED.city,
-                    state = EXCLUDED.state,
-                    state_name = EXCLUDED.state_name,
-                    county = EXCLUDED.county,
-                    congressional_district = EXCLUDED.congressional_district,
-                    latitude = EXCLUDED.latitude,
-                    longitude = EXCLUDED.longitude,
-                    updated_at = CURRENT_TIMESTAMP
-                RETURNING id
-            """
-            
-            cursor.execute(insert_query, geography_data)
+            cursor.execute(INSERT_GEOGRAPHY_SQL, geography_data)
             geo_id = cursor.fetchone()[0]
-            self.db_connection.commit()
             
             return geo_id
             
         except Exception as e:
-            self.db_connection.rollback()
             self.logger.error(f"Error inserting geography data: {e}")
             raise
-        finally:
-            cursor.close()
     
-    def insert_representative(self, rep_data: Dict) -> int:
-        """Insert representative data and return ID"""
-        cursor = self.db_connection.cursor()
+    def bulk_upsert_geography(self, rows: List[Dict]) -> Dict[str, int]:
+        """Upsert many geography rows in one statement and return IDs keyed by ZIP code"""
+        # A statement may not touch the same conflict row twice; the last row wins
+        rows = list({row['zip_code']: row for row in rows}.values())
+        if not rows:
+            return {}
+        
+        cursor = self._cursor
         
         try:
-            # Check if representative already exists (by name and title)
-            check_query = """
-                SELECT id FROM representatives 
-                WHERE name = %(name)s AND title = %(title)s
-            """
-            cursor.execute(check_query, rep_data)
-            existing = cursor.fetchone()
+            returned = execute_values(
+                cursor, UPSERT_GEOGRAPHIES_SQL, rows, template=UPSERT_GEOGRAPHIES_TEMPLATE,
+                page_size=500, fetch=True
+            )
+            return {zip_code: geo_id for geo_id, zip_code in returned}
             
-            if existing:
-                # Update existing representative
-                rep_id = existing[0]
-                update_query = """
-                    UPDATE representatives SET
-                        party = %(party)s,
-                        branch = %(branch)s,
-                        office_type = %(office_type)s,
-                        phone = %(phone)s,
-                        email = %(email)s,
-                        website = %(website)s,
-                        photo_url = %(photo_url)s,
-                        address_line1 = %(address_line1)s,
-                        address_line2 = %(address_line2)s,
-                        address_city = %(address_city)s,
-                        address_state = %(address_state)s,
-                        address_zip = %(address_zip)s,
-                        term_start = %(term_start)s,
-                        term_end = %(term_end)s,
-                        is_active = %(is_active)s,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE id = %(id)s
-                """
-                rep_data['id'] = rep_id
-                cursor.execute(update_query, rep_data)
-            else:
-                # Insert new representative
-                insert_query = """
-                    INSERT INTO representatives (
-                        name, title, party, branch, office_type, phone, email, 
-                        website, photo_url, address_line1, address_line2, 
-                        address_city, address_state, address_zip, term_start, 
-                        term_end, is_active
-                    ) VALUES (
-                        %(name)s, %(title)s, %(party)s, %(branch)s, %(office_type)s, 
-                        %(phone)s, %(email)s, %(website)s, %(photo_url)s, 
-                        %(address_line1)s, %(address_line2)s, %(address_city)s, 
-                        %(address_state)s, %(address_zip)s, %(term_start)s, 
-                        %(term_end)s, %(is_active)s
-                    ) RETURNING id
-                """
-                cursor.execute(insert_query, rep_data)
-                rep_id = cursor.fetchone()[0]
+        except Exception as e:
+            self.logger.error(f"Error bulk upserting geography data: {e}")
+            raise
+    
+    def bulk_load_geography_csv(self, path_or_iter: Union[str, Iterable[Dict]]) -> int:
+        """Bulk load geography rows via COPY into a staging table and merge them; returns row count"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        row_count = 0
+        
+        if isinstance(path_or_iter, str):
+            with open(path_or_iter, newline='') as f:
+                for row in csv.DictReader(f):
+                    writer.writerow([row.get(col) or None for col in GEOGRAPHY_COLUMNS])
+                    row_count += 1
+        else:
+            for row in path_or_iter:
+                writer.writerow([row.get(col) for col in GEOGRAPHY_COLUMNS])
+                row_count += 1
+        
+        if not row_count:
+            return 0
+        
+        buffer.seek(0)
+        cursor = self._cursor
+        
+        try:
+            cursor.execute(TRUNCATE_GEOGRAPHY_STAGING_SQL)
+            cursor.copy_expert(COPY_GEOGRAPHY_STAGING_SQL, buffer)
             
+            cursor.execute(MERGE_GEOGRAPHY_STAGING_SQL)
+            cursor.execute(TRUNCATE_GEOGRAPHY_STAGING_SQL)
             self.db_connection.commit()
-            return rep_id
+            
+            self.logger.info(f"Bulk loaded {row_count} geography rows")
+            return row_count
             
         except Exception as e:
             self.db_connection.rollback()
+            self.logger.error(f"Error bulk loading geography data: {e}")
+            raise
+    
+    def insert_representative(self, rep_data: Dict) -> int:
+        """Insert or update representative data and return ID"""
+        cursor = self._cursor
+        
+        try:
+            cursor.execute(UPSERT_REPRESENTATIVE_SQL, rep_data)
+            return cursor.fetchone()[0]
+            
+        except Exception as e:
             self.logger.error(f"Error inserting representative data: {e}")
             raise
-        finally:
-            cursor.close()
+    
+    def bulk_upsert_representatives(self, rows: Union[List[Dict], 'RepBatch']) -> List[int]:
+        """Upsert many representatives in one statement and return their IDs in input order"""
+        batch = rows if isinstance(rows, RepBatch) else RepBatch.from_reps(rows)
+        if not len(batch):
+            return []
+        
+        cursor = self._cursor
+        
+        try:
+            return batch.flush(cursor)
+            
+        except Exception as e:
+            self.logger.error(f"Error bulk upserting representatives: {e}")
+            raise
     
     def create_geography_mapping(self, rep_id: int, geo_id: int, jurisdiction_level: str):
         """Create mapping between representative and geography"""
-        cursor = self.db_connection.cursor()
+        cursor = self._cursor
         
         try:
-            mapping_query = """
-                INSERT INTO rep_geography_map (
-                    representative_id, geography_id, jurisdiction_level
-                ) VALUES (%s, %s, %s)
-                ON CONFLICT (representative_id, geography_id) DO UPDATE SET
-                    jurisdiction_level = EXCLUDED.jurisdiction_level
-            """
-            
-            cursor.execute(mapping_query, (rep_id, geo_id, jurisdiction_level))
-            self.db_connection.commit()
+            cursor.execute(INSERT_GEOGRAPHY_MAPPING_SQL, (rep_id, geo_id, jurisdiction_level))
             
         except Exception as e:
-            self.db_connection.rollback()
             self.logger.error(f"Error creating geography mapping: {e}")
             raise
-        finally:
-            cursor.close()
+    
+    def bulk_create_geography_mappings(self, pairs: Iterable[Tuple[int, int, str]]):
+        """Create many (rep_id, geo_id, jurisdiction_level) mappings in one statement"""
+        # A statement may not touch the same conflict row twice; the last mapping wins
+        rows = list({(rep_id, geo_id): (rep_id, geo_id, level) for rep_id, geo_id, level in pairs}.values())
+        if not rows:
+            return
+        
+        cursor = self._cursor
+        
+        try:
+            execute_values(cursor, INSERT_GEOGRAPHY_MAPPINGS_SQL, rows, page_size=1000)
+            
+        except Exception as e:
+            self.logger.error(f"Error creating geography mappings: {e}")
+            raise
+    
+    def flush(self):
+        """Commit pending writes; helpers leave transaction control to the caller"""
+        self.db_connection.commit()
+    
+    def rollback(self):
+        """Discard pending writes after a failed batch"""
+        self.db_connection.rollback()
     
     def respect_rate_limit(self, delay: float = None):
         """Add delay between requests to be respectful"""
         if delay is None:
-            delay = float(os.getenv('SCRAPER_DELAY_MS', '2000')) / 1000
+            delay = default_request_delay()
         
         time.sleep(delay)
     
+    async def respect_rate_limit_async(self, delay: float = None):
+        """Async variant of respect_rate_limit that yields to other tasks"""
+        if delay is None:
+            delay = default_request_delay()
+        
+        await asyncio.sleep(delay)
+    
+    def set_async_client(self, client: Optional[httpx.AsyncClient]):
+        """Use a caller-owned async client (e.g. one shared across scrapers), or None to detach"""
+        self._aclient = client
+        self._owns_aclient = False
+    
+    async def close_async_client(self):
+        """Close the async HTTP client if this scraper opened it; caller-owned clients are left open"""
+        if self._aclient is not None and self._owns_aclient:
+            await self._aclient.aclose()
+            self._aclient = None
+            self._owns_aclient = False
+    
     def close_connection(self):
-        """Close database connection"""
+        """Return database connection to the shared pool"""
+        if self._cursor is not None:
+            self._cursor.close()
+            self._cursor = None
+        
         if self.db_connection:
-            self.db_connection.close()
-            self.logger.info("Database connection closed")
+            db_pool.putconn(self.db_connection)
+            self.db_connection = None
+            self.logger.info("Database connection returned to pool")
     
     def __enter__(self):
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.db_connection:
+            if exc_type is None:
+                self.flush()
+            else:
+                self.rollback()
         self.close_connection()
         
     # Abstract methods to be implemented by subclasses
@@ -272,7 +583,15 @@ class BaseScraper:
         """Abstract method to scrape representatives for a ZIP code"""
         raise NotImplementedError("Subclass must implement scrape_representatives method")
     
+    async def scrape_representatives_async(self, zip_code: str) -> List[Dict]:
+        """Async variant of scrape_representatives; defaults to running the sync one in a thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.scrape_representatives, zip_code)
+    
+    def warm_up(self):
+        """Load blocking reference data up front; call off the event loop before async work"""
+        pass
+    
     def validate_zip_code(self, zip_code: str) -> bool:
-        """Validate ZIP code format"""
-        import re
-        return bool(re.match(r'^\d{5}$', zip_code))
\ No newline at end of file
+        """Validate ZIP code format (exactly five ASCII digits)"""
+        return len(zip_code) == 5 and zip_code.isascii() and zip_code.isdigit()
\ No newline at end of file
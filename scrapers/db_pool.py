@@ -0,0 +1,51 @@
+"""
+Process-wide PostgreSQL connection pool shared by all scrapers
+"""
+
+import os
+import threading
+import psycopg2.pool
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    """Create the connection pool on first use and return it"""
+    global _pool
+    
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = psycopg2.pool.ThreadedConnectionPool(
+                    int(os.getenv('DB_POOL_MIN', '2')),
+                    int(os.getenv('DB_POOL_MAX', '20')),
+                    host=os.getenv('DB_HOST', 'localhost'),
+                    database=os.getenv('DB_NAME', 'political_reps_db'),
+                    user=os.getenv('DB_USER', 'postgres'),
+                    password=os.getenv('DB_PASSWORD'),
+                    port=os.getenv('DB_PORT', '5432')
+                )
+    
+    return _pool
+
+def getconn():
+    """Borrow a connection from the pool"""
+    return get_pool().getconn()
+
+def putconn(conn, close: bool = False):
+    """Return a borrowed connection to the pool"""
+    if _pool is not None:
+        _pool.putconn(conn, close=close)
+
+def closeall():
+    """Close every pooled connection (call once at process shutdown)"""
+    global _pool
+    
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
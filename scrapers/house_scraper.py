@@ -1,6 +1,67 @@
-from base_scraper import BaseScraper
-from typing import List, Dict
+from base_scraper import BaseScraper, TokenBucket, default_request_delay
+from reference_data import SAMPLE_HOUSE_REPS, SENATORS_BY_STATE, GOVERNORS_BY_STATE
+from queries import SELECT_ZIP_STATES_SQL
+from bs4 import SoupStrainer
+from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+import asyncio
+import html
+import logging
 import re
+import threading
+import db_pool
+
+_REP_HREF_RE = re.compile(r'/representatives/')
+_DISTRICT_RE = re.compile(r'district[/-]?(\d+)', re.IGNORECASE)
+
+# Representative links in the raw lookup page: (quote, href, anchor text)
+_REP_LINK_RE = re.compile(
+    rb'<a\s[^>]*?href=(["\'])([^"\']*/representatives/[^"\']*)\1[^>]*>([^<]+)</a>',
+    re.IGNORECASE
+)
+
+# Only representative links are needed from the lookup page
+_REP_LINK_STRAINER = SoupStrainer('a', href=_REP_HREF_RE)
+
+# ZIP -> state lookup, loaded from the geography table on first use
+_ZIP_TO_STATE: Dict[str, str] = {}
+_zip_table_lock = threading.Lock()
+
+# Demo ZIP codes, used when the geography table has not been populated
+_DEMO_ZIP_TO_STATE = {
+    '11354': 'NY',  # Flushing, NY
+    '20301': 'DC',  # Washington, DC
+    '90210': 'CA',  # Beverly Hills, CA
+}
+
+# Parsed House lookups keyed by (url, form data), shared across scraper instances
+_LOOKUP_CACHE: 'OrderedDict[Tuple, Dict]' = OrderedDict()
+_LOOKUP_CACHE_SIZE = 10000
+_lookup_cache_lock = threading.Lock()
+
+def _lookup_cache_get(key: Tuple) -> Optional[Dict]:
+    """Return a cached lookup result and mark it most recently used"""
+    with _lookup_cache_lock:
+        rep_info = _LOOKUP_CACHE.get(key)
+        if rep_info is not None:
+            _LOOKUP_CACHE.move_to_end(key)
+        return rep_info
+
+def _lookup_cache_put(key: Tuple, rep_info: Dict) -> Dict:
+    """Cache a parsed lookup result (read-only), evicting the oldest entry when full"""
+    rep_info = MappingProxyType(rep_info)
+    with _lookup_cache_lock:
+        _LOOKUP_CACHE[key] = rep_info
+        _LOOKUP_CACHE.move_to_end(key)
+        if len(_LOOKUP_CACHE) > _LOOKUP_CACHE_SIZE:
+            _LOOKUP_CACHE.popitem(last=False)
+    return rep_info
+
+# Maximum in-flight ZIP lookups for the async and threaded scrapers
+ASYNC_CONCURRENCY = 16
+THREAD_WORKERS = 16
 
 class HouseRepresentativeScraper(BaseScraper):
     """Scraper for House of Representatives data from house.gov"""
@@ -35,14 +96,81 @@ class HouseRepresentativeScraper(BaseScraper):
             self.logger.error(f"Error scraping representatives for {zip_code}: {e}")
             return []
     
+    async def scrape_representatives_async(self, zip_code: str) -> List[Dict]:
+        """Scrape House representative data for a ZIP code without blocking the event loop"""
+        if not self.validate_zip_code(zip_code):
+            self.logger.error(f"Invalid ZIP code format: {zip_code}")
+            return []
+            
+        try:
+            representatives = []
+            
+            house_rep = await self.get_house_rep_by_zip_async(zip_code)
+            if house_rep:
+                representatives.append(house_rep)
+            
+            if house_rep and 'state' in house_rep:
+                senators = self.get_senators_by_state(house_rep['state'])
+                representatives.extend(senators)
+            
+            return representatives
+            
+        except Exception as e:
+            self.logger.error(f"Error scraping representatives for {zip_code}: {e}")
+            return []
+    
+    async def scrape_many_async(self, zip_codes: List[str],
+                                concurrency: int = ASYNC_CONCURRENCY) -> Dict[str, List[Dict]]:
+        """Scrape many ZIP codes concurrently, bounded by a semaphore"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        # The ZIP table load blocks, so do it in a thread before any lookups run on the loop
+        await asyncio.get_running_loop().run_in_executor(None, self.warm_up)
+        
+        async def bounded(zip_code: str) -> List[Dict]:
+            async with semaphore:
+                reps = await self.scrape_representatives_async(zip_code)
+                await self.respect_rate_limit_async()
+                return reps
+        
+        try:
+            results = await asyncio.gather(*[bounded(z) for z in zip_codes])
+            return dict(zip(zip_codes, results))
+        finally:
+            await self.close_async_client()
+    
+    def scrape_many(self, zip_codes: List[str], workers: int = THREAD_WORKERS) -> Dict[str, List[Dict]]:
+        """Scrape many ZIP codes on a thread pool, paced by a shared token bucket"""
+        delay = default_request_delay()
+        bucket = TokenBucket(1 / delay, burst=workers) if delay > 0 else None
+        
+        def paced(zip_code: str) -> List[Dict]:
+            if bucket:
+                bucket.acquire()
+            return self.scrape_representatives(zip_code)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(paced, zip_codes)
+            return dict(zip(zip_codes, results))
+    
+    def house_lookup_form(self, zip_code: str) -> Dict:
+        """Form data for the official ZIP lookup service"""
+        return {
+            'ZIP': zip_code,
+            'Submit': 'FIND YOUR REP'
+        }
+    
     def get_house_rep_by_zip(self, zip_code: str) -> Dict:
         """Get House representative using ZIP code lookup"""
         try:
             # First try the official ZIP lookup service
-            data = {
-                'ZIP': zip_code,
-                'Submit': 'FIND YOUR REP'
-            }
+            data = self.house_lookup_form(zip_code)
+            
+            # Skip the network entirely for ZIPs already looked up this session
+            cache_key = (self.house_lookup_url, frozenset(data.items()))
+            cached = _lookup_cache_get(cache_key)
+            if cached is not None:
+                return cached
             
             response = self.make_request(
                 self.house_lookup_url, 
@@ -51,13 +179,11 @@ class HouseRepresentativeScraper(BaseScraper):
                 allow_redirects=True
             )
             
-            soup = self.parse_html(response.content)
-            
             # Parse representative information from response
-            rep_info = self.parse_house_lookup_response(soup, zip_code)
+            rep_info = self.parse_house_lookup_html(self.read_body(response), zip_code)
             
             if rep_info:
-                return rep_info
+                return _lookup_cache_put(cache_key, rep_info)
             
             # Fallback: Try to get representative info from sample data
             return self.get_sample_house_rep(zip_code)
@@ -66,277 +192,148 @@ class HouseRepresentativeScraper(BaseScraper):
             self.logger.error(f"Error getting House rep for {zip_code}: {e}")
             return self.get_sample_house_rep(zip_code)
     
-    def parse_house_lookup_response(self, soup, zip_code: str) -> Dict:
-        """Parse House lookup response HTML"""
+    async def get_house_rep_by_zip_async(self, zip_code: str) -> Dict:
+        """Async variant of get_house_rep_by_zip"""
         try:
-            # Look for representative information in various possible structures
-            rep_data = {}
+            data = self.house_lookup_form(zip_code)
+            
+            cache_key = (self.house_lookup_url, frozenset(data.items()))
+            cached = _lookup_cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
+            body = await self.fetch_body_async(
+                self.house_lookup_url,
+                method='POST',
+                data=data
+            )
+            
+            rep_info = self.parse_house_lookup_html(body, zip_code)
             
-            # Try to find representative name and district
-            # The structure may vary, so we try multiple selectors
+            if rep_info:
+                return _lookup_cache_put(cache_key, rep_info)
+            
+            return self.get_sample_house_rep(zip_code)
             
+        except Exception as e:
+            self.logger.error(f"Error getting House rep for {zip_code}: {e}")
+            return self.get_sample_house_rep(zip_code)
+    
+    def parse_house_lookup_html(self, content: bytes, zip_code: str) -> Dict:
+        """Parse House lookup response with a single regex pass, falling back to BeautifulSoup"""
+        try:
+            for match in _REP_LINK_RE.finditer(content):
+                name = self.clean_text(html.unescape(match.group(3).decode('utf-8', 'replace')))
+                if name:
+                    href = html.unescape(match.group(2).decode('utf-8', 'replace'))
+                    return self.build_house_rep(name, href, zip_code)
+        except Exception as e:
+            self.logger.error(f"Error parsing House lookup response: {e}")
+        
+        # Markup the regex does not recognise (e.g. nested tags in the link)
+        soup = self.parse_html(content, parse_only=_REP_LINK_STRAINER)
+        return self.parse_house_lookup_response(soup, zip_code)
+    
+    def parse_house_lookup_response(self, soup, zip_code: str) -> Dict:
+        """Parse House lookup response HTML"""
+        try:
             # Look for links to representative pages
-            rep_links = soup.find_all('a', href=re.compile(r'/representatives/'))
+            rep_links = soup.find_all('a', href=_REP_HREF_RE)
             
             for link in rep_links:
                 if link.text and len(link.text.strip()) > 0:
-                    name = self.clean_text(link.text)
-                    
-                    # Extract district from URL or surrounding text
-                    href = link.get('href', '')
-                    district_match = re.search(r'district[/-]?(\d+)', href, re.IGNORECASE)
-                    
-                    if district_match:
-                        district = district_match.group(1).zfill(2)
-                    else:
-                        district = "00"  # Default if not found
-                    
-                    # Determine state from ZIP code (simplified mapping)
-                    state = self.get_state_from_zip(zip_code)
-                    
-                    rep_data = {
-                        'name': name,
-                        'title': f'U.S. House Rep, {state}-{district}',
-                        'party': '',  # Would need additional scraping
-                        'branch': 'federal',
-                        'office_type': 'House Representative',
-                        'phone': '',
-                        'email': '',
-                        'website': f"https://www.house.gov{href}" if href.startswith('/') else href,
-                        'photo_url': '',
-                        'address_line1': '',
-                        'address_line2': '',
-                        'address_city': '',
-                        'address_state': state,
-                        'address_zip': '',
-                        'term_start': None,
-                        'term_end': None,
-                        'is_active': True,
-                        'state': state,
-                        'district': district
-                    }
-                    break
+                    return self.build_house_rep(self.clean_text(link.text), link.get('href', ''), zip_code)
             
-            return rep_data
+            return {}
             
         except Exception as e:
             self.logger.error(f"Error parsing House lookup response: {e}")
             return {}
     
+    def build_house_rep(self, name: str, href: str, zip_code: str) -> Dict:
+        """Build a House representative record from a lookup result link"""
+        # Extract district from URL
+        district_match = _DISTRICT_RE.search(href)
+        
+        if district_match:
+            district = district_match.group(1).zfill(2)
+        else:
+            district = "00"  # Default if not found
+        
+        # Determine state from ZIP code
+        state = self.get_state_from_zip(zip_code)
+        
+        return {
+            'name': name,
+            'title': f'U.S. House Rep, {state}-{district}',
+            'party': '',  # Would need additional scraping
+            'branch': 'federal',
+            'office_type': 'House Representative',
+            'phone': '',
+            'email': '',
+            'website': f"https://www.house.gov{href}" if href.startswith('/') else href,
+            'photo_url': '',
+            'address_line1': '',
+            'address_line2': '',
+            'address_city': '',
+            'address_state': state,
+            'address_zip': '',
+            'term_start': None,
+            'term_end': None,
+            'is_active': True,
+            'state': state,
+            'district': district
+        }
+    
     def get_sample_house_rep(self, zip_code: str) -> Dict:
         """Get sample House representative data for demo purposes"""
-        # Sample data for common ZIP codes for demonstration
-        sample_data = {
-            '11354': {
-                'name': 'Grace Meng',
-                'title': 'U.S. House Rep, NY-6',
-                'party': 'Democratic',
-                'branch': 'federal',
-                'office_type': 'House Representative',
-                'phone': '(202) 225-2601',
-                'email': '',
-                'website': 'https://meng.house.gov',
-                'photo_url': '',
-                'address_line1': '2209 Rayburn House Office Building',
-                'address_line2': '',
-                'address_city': 'Washington',
-                'address_state': 'DC',
-                'address_zip': '20515',
-                'term_start': None,
-                'term_end': None,
-                'is_active': True,
-                'state': 'NY',
-                'district': '06'
-            },
-            '20301': {
-                'name': 'Eleanor Holmes Norton',
-                'title': 'U.S. House Delegate, DC-At Large',
-                'party': 'Democratic',
-                'branch': 'federal',
-                'office_type': 'House Delegate',
-                'phone': '(202) 225-8050',
-                'email': '',
-                'website': 'https://norton.house.gov',
-                'photo_url': '',
-                'address_line1': '2136 Rayburn House Office Building',
-                'address_line2': '',
-                'address_city': 'Washington',
-                'address_state': 'DC',
-                'address_zip': '20515',
-                'term_start': None,
-                'term_end': None,
-                'is_active': True,
-                'state': 'DC',
-                'district': '00'
-            },
-            '90210': {
-                'name': 'Brad Sherman',
-                'title': 'U.S. House Rep, CA-30',
-                'party': 'Democratic',
-                'branch': 'federal',
-                'office_type': 'House Representative',
-                'phone': '(202) 225-5911',
-                'email': '',
-                'website': 'https://sherman.house.gov',
-                'photo_url': '',
-                'address_line1': '2181 Rayburn House Office Building',
-                'address_line2': '',
-                'address_city': 'Washington',
-                'address_state': 'DC',
-                'address_zip': '20515',
-                'term_start': None,
-                'term_end': None,
-                'is_active': True,
-                'state': 'CA',
-                'district': '30'
-            }
-        }
-        
-        return sample_data.get(zip_code, {})
+        return SAMPLE_HOUSE_REPS.get(zip_code, {})
     
     def get_senators_by_state(self, state: str) -> List[Dict]:
         """Get senators for a given state"""
-        # Sample senators data for demonstration
-        senators_data = {
-            'NY': [
-                {
-                    'name': 'Chuck Schumer',
-                    'title': 'U.S. Senator, NY',
-                    'party': 'Democratic',
-                    'branch': 'federal',
-                    'office_type': 'Senator',
-                    'phone': '(202) 224-6542',
-                    'email': '',
-                    'website': 'https://www.schumer.senate.gov',
-                    'photo_url': '',
-                    'address_line1': '322 Hart Senate Office Building',
-                    'address_line2': '',
-                    'address_city': 'Washington',
-                    'address_state': 'DC',
-                    'address_zip': '20510',
-                    'term_start': None,
-                    'term_end': None,
-                    'is_active': True
-                },
-                {
-                    'name': 'Kirsten Gillibrand',
-                    'title': 'U.S. Senator, NY',
-                    'party': 'Democratic',
-                    'branch': 'federal',
-                    'office_type': 'Senator',
-                    'phone': '(202) 224-4451',
-                    'email': '',
-                    'website': 'https://www.gillibrand.senate.gov',
-                    'photo_url': '',
-                    'address_line1': '478 Russell Senate Office Building',
-                    'address_line2': '',
-                    'address_city': 'Washington',
-                    'address_state': 'DC',
-                    'address_zip': '20510',
-                    'term_start': None,
-                    'term_end': None,
-                    'is_active': True
-                }
-            ],
-            'CA': [
-                {
-                    'name': 'Dianne Feinstein',
-                    'title': 'U.S. Senator, CA',
-                    'party': 'Democratic',
-                    'branch': 'federal',
-                    'office_type': 'Senator',
-                    'phone': '(202) 224-3841',
-                    'email': '',
-                    'website': 'https://www.feinstein.senate.gov',
-                    'photo_url': '',
-                    'address_line1': '331 Hart Senate Office Building',
-                    'address_line2': '',
-                    'address_city': 'Washington',
-                    'address_state': 'DC',
-                    'address_zip': '20510',
-                    'term_start': None,
-                    'term_end': None,
-                    'is_active': True
-                },
-                {
-                    'name': 'Alex Padilla',
-                    'title': 'U.S. Senator, CA',
-                    'party': 'Democratic',
-                    'branch': 'federal',
-                    'office_type': 'Senator',
-                    'phone': '(202) 224-3553',
-                    'email': '',
-                    'website': 'https://www.padilla.senate.gov',
-                    'photo_url': '',
-                    'address_line1': '112 Hart Senate Office Building',
-                    'address_line2': '',
-                    'address_city': 'Washington',
-                    'address_state': 'DC',
-                    'address_zip': '20510',
-                    'term_start': None,
-                    'term_end': None,
-                    'is_active': True
-                }
-            ],
-            'DC': []  # DC has no voting senators
-        }
-        
-        return senators_data.get(state, [])
+        return list(SENATORS_BY_STATE.get(state, ()))
+    
+    def warm_up(self):
+        """Load the ZIP -> state table so lookups never query the database mid-scrape"""
+        self._load_zip_table()
+    
+    @classmethod
+    def _load_zip_table(cls):
+        """Load the full ZIP -> state mapping from the geography table once per process"""
+        with _zip_table_lock:
+            if _ZIP_TO_STATE:
+                return
+            
+            # Use a connection of its own so a failure cannot roll back a scraper's pending writes
+            try:
+                conn = db_pool.getconn()
+            except Exception as e:
+                logging.getLogger(cls.__name__).warning(f"Could not load ZIP table: {e}")
+            else:
+                try:
+                    with conn.cursor() as cursor:
+                        cursor.execute(SELECT_ZIP_STATES_SQL)
+                        _ZIP_TO_STATE.update(cursor.fetchall())
+                except Exception as e:
+                    # Fall back to the demo mapping
+                    logging.getLogger(cls.__name__).warning(f"Could not load ZIP table: {e}")
+                finally:
+                    # End the read transaction before handing the connection back
+                    if not conn.closed:
+                        conn.rollback()
+                    db_pool.putconn(conn)
+            
+            for zip_code, state in _DEMO_ZIP_TO_STATE.items():
+                _ZIP_TO_STATE.setdefault(zip_code, state)
     
     def get_state_from_zip(self, zip_code: str) -> str:
-        """Get state abbreviation from ZIP code (simplified mapping)"""
-        # Simplified ZIP to state mapping for common demo ZIP codes
-        zip_to_state = {
-            '11354': 'NY',  # Flushing, NY
-            '20301': 'DC',  # Washington, DC
-            '90210': 'CA',  # Beverly Hills, CA
-        }
+        """Get state abbreviation from ZIP code"""
+        if not _ZIP_TO_STATE:
+            self._load_zip_table()
         
-        # For production, you would use a comprehensive ZIP code database
-        return zip_to_state.get(zip_code, 'XX')
+        return _ZIP_TO_STATE.get(zip_code, 'XX')
     
     def get_state_governors(self, state: str) -> List[Dict]:
         """Get governor information for a state"""
-        governors_data = {
-            'NY': {
-                'name': 'Kathy Hochul',
-                'title': 'Governor, New York',
-                'party': 'Democratic',
-                'branch': 'state',
-                'office_type': 'Governor',
-                'phone': '(518) 474-8390',
-                'email': '',
-                'website': 'https://www.governor.ny.gov',
-                'photo_url': '',
-                'address_line1': 'NYS State Capitol Building',
-                'address_line2': '',
-                'address_city': 'Albany',
-                'address_state': 'NY',
-                'address_zip': '12224',
-                'term_start': None,
-                'term_end': None,
-                'is_active': True
-            },
-            'CA': {
-                'name': 'Gavin Newsom',
-                'title': 'Governor, California',
-                'party': 'Democratic',
-                'branch': 'state',
-                'office_type': 'Governor',
-                'phone': '(916) 445-2841',
-                'email': '',
-                'website': 'https://www.gov.ca.gov',
-                'photo_url': '',
-                'address_line1': '1303 10th Street, Suite 1173',
-                'address_line2': '',
-                'address_city': 'Sacramento',
-                'address_state': 'CA',
-                'address_zip': '95814',
-                'term_start': None,
-                'term_end': None,
-                'is_active': True
-            }
-        }
-        
-        governor = governors_data.get(state)
+        governor = GOVERNORS_BY_STATE.get(state)
         return [governor] if governor else []
\ No newline at end of file
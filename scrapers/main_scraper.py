@@ -4,245 +4,553 @@ Main scraper orchestrator for Political Representatives API
 Handles scraping from multiple sources and data processing
 """
 
+import os
+import re
 import sys
+import json
 import argparse
 import logging
-from typing import List, Dict
+import threading
+import asyncio
+import httpx
+from dataclasses import dataclass, field
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+)
+from typing import Callable, Dict, Iterable, Iterator, List, TextIO
 from house_scraper import HouseRepresentativeScraper
-from base_scraper import BaseScraper
+from base_scraper import BaseScraper, TokenBucket, default_request_delay, REQUEST_TIMEOUT
+from reference_data import GEOGRAPHY_BY_ZIP, NORMALIZED_TAG
+import db_pool
+
+# Number of ZIP codes processed concurrently
+PARALLEL_WORKERS = int(os.getenv('SCRAPER_PARALLEL', '8'))
+
+# Representative fields normalized by normalize_representative_data
+_STR_FIELDS = (
+    'name', 'title', 'party', 'office_type', 'phone', 'email', 'website',
+    'photo_url', 'address_line1', 'address_line2', 'address_city',
+    'address_state', 'address_zip'
+)
+_PASSTHROUGH_FIELDS = ('term_start', 'term_end')
+
+def _build_normalizer():
+    """Compile a normalizer with one literal dict display for the fixed field set"""
+    # Strip text fields, converting empty strings to None for database storage
+    entries = [f"{key!r}: (rep.get({key!r}) or '').strip() or None" for key in _STR_FIELDS]
+    entries.append("'branch': (rep.get('branch') or 'federal').lower()")
+    entries.extend(f"{key!r}: rep.get({key!r}) or None" for key in _PASSTHROUGH_FIELDS)
+    entries.append("'is_active': rep.get('is_active', True)")
+    
+    namespace = {}
+    exec("def _normalize_rep(rep):\n    return {" + ", ".join(entries) + "}", namespace)
+    return namespace['_normalize_rep']
+
+_normalize_rep = _build_normalizer()
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# Jaccard similarity of name/title tokens above which representatives are near-duplicates
+NEAR_DUP_THRESHOLD = 0.85
+
+def _name_title_tokens(name: str, title: str) -> frozenset:
+    """Lowercased word tokens in a representative's name and title"""
+    return frozenset(_TOKEN_RE.findall(f"{name} {title}".lower()))
+
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    """Jaccard similarity of two token sets"""
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+# Scrapers queried for every ZIP code, created on first use
+SCRAPER_CLASSES = {
+    'house': HouseRepresentativeScraper
+}
+
+# Scraper calls allowed back to back before the shared rate limit applies
+RATE_LIMIT_BURST = 5
+
+# ZIP codes stored per transaction when processing in batches
+FLUSH_EVERY = 1000
+
+# In-flight ZIP codes and HTTP connections for the asyncio pipeline
+ASYNC_CONCURRENCY = 20
+ASYNC_MAX_CONNECTIONS = 50
+
+def iter_zip_codes(path: str) -> Iterator[str]:
+    """Yield non-blank ZIP codes from a file one line at a time"""
+    with open(path, 'r') as f:
+        for line in f:
+            zip_code = line.strip()
+            if zip_code:
+                yield zip_code
+
+@dataclass
+class ZipResult:
+    """Outcome of processing one ZIP code"""
+    zip_code: str
+    representatives: List[Dict] = field(default_factory=list)
+    geography: Dict = field(default_factory=dict)
+    success: bool = False
+    errors: List[str] = field(default_factory=list)
+
+class ResultWriter:
+    """Streams final ZIP results as NDJSON, keeping only summary counts in memory"""
+    
+    def __init__(self, out: TextIO = None):
+        self.out = out
+        self.total = 0
+        self.successful = 0
+        self._lock = threading.Lock()
+    
+    def write(self, result: ZipResult):
+        """Count a result and append it to the output file, if any"""
+        with self._lock:
+            self.total += 1
+            if result.success:
+                self.successful += 1
+            if self.out:
+                json.dump(vars(result), self.out, default=str)
+                self.out.write('\n')
 
 class RepresentativeDataProcessor:
     """Main class to orchestrate scraping and data processing"""
     
-    def __init__(self):
+    def __init__(self, flush_every: int = FLUSH_EVERY):
         self.logger = logging.getLogger(__name__)
-        self.scrapers = {
-            'house': HouseRepresentativeScraper()
-        }
+        self.db_lock = threading.Lock()
+        if flush_every < 1:
+            raise ValueError(f"flush_every must be at least 1, got {flush_every}")
+        self.flush_every = flush_every
+        
+        # One bucket, shared with every scraper, paces outgoing HTTP requests across
+        # all workers; cache hits and other non-network work take no token
+        delay = default_request_delay()
+        self.rate_limiter = TokenBucket(1 / delay, burst=RATE_LIMIT_BURST) if delay > 0 else None
+        
+        # Scrapers open a session and database connection, so defer them until needed
+        self.scrapers = {}
+        self._scrapers_lock = threading.Lock()
         
-    def process_zip_code(self, zip_code: str) -> Dict:
+        # Shared pool for querying several sources per ZIP in parallel; a single
+        # source runs inline on the calling worker instead
+        self._scraper_executor = (
+            ThreadPoolExecutor(max_workers=PARALLEL_WORKERS * len(SCRAPER_CLASSES))
+            if len(SCRAPER_CLASSES) > 1 else None
+        )
+    
+    def _get_scraper(self, name: str) -> BaseScraper:
+        """Return the named scraper, creating it on first access"""
+        scraper = self.scrapers.get(name)
+        if scraper is None:
+            with self._scrapers_lock:
+                scraper = self.scrapers.get(name)
+                if scraper is None:
+                    scraper = SCRAPER_CLASSES[name]()
+                    scraper.rate_limiter = self.rate_limiter
+                    self.scrapers[name] = scraper
+        return scraper
+    
+    def process_zip_code(self, zip_code: str, store: bool = True) -> ZipResult:
         """Process a single ZIP code through all scrapers"""
         self.logger.info(f"Processing ZIP code: {zip_code}")
         
-        results = {
-            'zip_code': zip_code,
-            'representatives': [],
-            'geography': {},
-            'success': False,
-            'errors': []
-        }
+        results = ZipResult(zip_code)
         
         try:
-            # Validate ZIP code format
-            if not self.validate_zip_code(zip_code):
-                results['errors'].append(f"Invalid ZIP code format: {zip_code}")
-                return results
-            
-            # Get geography data
-            geography_data = self.get_geography_data(zip_code)
-            if not geography_data:
-                results['errors'].append(f"Could not determine geography for ZIP code: {zip_code}")
+            if not self.prepare_zip_code(results):
                 return results
             
-            results['geography'] = geography_data
-            
-            # Scrape representatives from all sources
+            # Query all sources in parallel; results are gathered in registration order
             all_representatives = []
             
-            for scraper_name, scraper in self.scrapers.items():
+            if self._scraper_executor:
+                futures = {
+                    scraper_name: self._scraper_executor.submit(self._scrape, scraper_name, zip_code)
+                    for scraper_name in SCRAPER_CLASSES
+                }
+                fetch = lambda scraper_name: futures[scraper_name].result()
+            else:
+                fetch = lambda scraper_name: self._scrape(scraper_name, zip_code)
+            
+            for scraper_name in SCRAPER_CLASSES:
                 try:
-                    self.logger.info(f"Using {scraper_name} scraper for {zip_code}")
-                    reps = scraper.scrape_representatives(zip_code)
-                    
-                    if reps:
-                        all_representatives.extend(reps)
-                        self.logger.info(f"{scraper_name} scraper found {len(reps)} representatives")
-                    else:
-                        self.logger.warning(f"{scraper_name} scraper found no representatives")
-                        
-                    # Respect rate limiting between scraper calls
-                    scraper.respect_rate_limit()
+                    reps = fetch(scraper_name)
+                    self.collect_representatives(scraper_name, reps, all_representatives)
                     
                 except Exception as e:
                     error_msg = f"Error in {scraper_name} scraper: {e}"
                     self.logger.error(error_msg)
-                    results['errors'].append(error_msg)
+                    results.errors.append(error_msg)
             
-            # Process and deduplicate representatives
-            processed_reps = self.process_representatives(all_representatives)
-            results['representatives'] = processed_reps
+            self.finish_zip_code(results, all_representatives, store)
             
-            # Store data in database
-            if processed_reps:
-                self.store_data(results)
-                results['success'] = True
-                self.logger.info(f"Successfully processed {len(processed_reps)} representatives for {zip_code}")
-            else:
-                results['errors'].append("No representatives found after processing")
+        except Exception as e:
+            error_msg = f"Error processing ZIP code {zip_code}: {e}"
+            self.logger.error(error_msg)
+            results.errors.append(error_msg)
+        
+        return results
+    
+    async def process_zip_code_async(self, zip_code: str, store: bool = True) -> ZipResult:
+        """Process a single ZIP code, querying all scrapers concurrently"""
+        self.logger.info(f"Processing ZIP code: {zip_code}")
+        
+        results = ZipResult(zip_code)
+        
+        try:
+            if not self.prepare_zip_code(results):
+                return results
+            
+            scraper_items = [(name, self._get_scraper(name)) for name in SCRAPER_CLASSES]
+            outcomes = await asyncio.gather(
+                *[scraper.scrape_representatives_async(zip_code) for _, scraper in scraper_items],
+                return_exceptions=True
+            )
+            
+            all_representatives = []
+            
+            for (scraper_name, _), outcome in zip(scraper_items, outcomes):
+                if isinstance(outcome, Exception):
+                    error_msg = f"Error in {scraper_name} scraper: {outcome}"
+                    self.logger.error(error_msg)
+                    results.errors.append(error_msg)
+                else:
+                    self.collect_representatives(scraper_name, outcome, all_representatives)
+            
+            # Database writes block, so run them off the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.finish_zip_code, results, all_representatives, store)
             
         except Exception as e:
             error_msg = f"Error processing ZIP code {zip_code}: {e}"
             self.logger.error(error_msg)
-            results['errors'].append(error_msg)
+            results.errors.append(error_msg)
         
         return results
     
+    def warm_up_scrapers(self):
+        """Create every scraper and load its reference data before work starts"""
+        for name in SCRAPER_CLASSES:
+            self._get_scraper(name).warm_up()
+    
+    def _scrape(self, scraper_name: str, zip_code: str) -> List[Dict]:
+        """Run one scraper for a ZIP code"""
+        self.logger.info(f"Using {scraper_name} scraper for {zip_code}")
+        return self._get_scraper(scraper_name).scrape_representatives(zip_code)
+    
+    def prepare_zip_code(self, results: ZipResult) -> bool:
+        """Validate the ZIP code and attach its geography; False if it cannot be processed"""
+        zip_code = results.zip_code
+        
+        # Validate ZIP code format
+        if not self.validate_zip_code(zip_code):
+            results.errors.append(f"Invalid ZIP code format: {zip_code}")
+            return False
+        
+        # Get geography data
+        geography_data = self.get_geography_data(zip_code)
+        if not geography_data:
+            results.errors.append(f"Could not determine geography for ZIP code: {zip_code}")
+            return False
+        
+        results.geography = geography_data
+        return True
+    
+    def collect_representatives(self, scraper_name: str, reps: List[Dict], all_representatives: List[Dict]):
+        """Add one scraper's representatives to the ZIP code's list"""
+        if reps:
+            all_representatives.extend(reps)
+            self.logger.info(f"{scraper_name} scraper found {len(reps)} representatives")
+        else:
+            self.logger.warning(f"{scraper_name} scraper found no representatives")
+    
+    def finish_zip_code(self, results: ZipResult, all_representatives: List[Dict], store: bool = True):
+        """Deduplicate, normalize and (unless the caller batches writes) store representatives"""
+        zip_code = results.zip_code
+        
+        # Process and deduplicate representatives
+        processed_reps = self.process_representatives(all_representatives)
+        results.representatives = processed_reps
+        
+        # Store data in database
+        if processed_reps:
+            if store:
+                self.store_data(results)
+            results.success = True
+            self.logger.info(f"Successfully processed {len(processed_reps)} representatives for {zip_code}")
+        else:
+            results.errors.append("No representatives found after processing")
+    
     def get_geography_data(self, zip_code: str) -> Dict:
         """Get geography data for a ZIP code"""
-        # Sample geography data for demo ZIP codes
-        geography_mapping = {
-            '11354': {
-                'zip_code': zip_code,
-                'city': 'Flushing',
-                'state': 'NY',
-                'state_name': 'New York',
-                'county': 'Queens',
-                'congressional_district': '06',
-                'latitude': 40.7598,
-                'longitude': -73.8303
-            },
-            '20301': {
-                'zip_code': zip_code,
-                'city': 'Washington',
-                'state': 'DC',
-                'state_name': 'District of Columbia',
-                'county': 'District of Columbia',
-                'congressional_district': '00',
-                'latitude': 38.9072,
-                'longitude': -77.0369
-            },
-            '90210': {
-                'zip_code': zip_code,
-                'city': 'Beverly Hills',
-                'state': 'CA',
-                'state_name': 'California',
-                'county': 'Los Angeles',
-                'congressional_district': '30',
-                'latitude': 34.0901,
-                'longitude': -118.4065
-            }
-        }
-        
-        return geography_mapping.get(zip_code, {})
+        geography = GEOGRAPHY_BY_ZIP.get(zip_code)
+        return {**geography, 'zip_code': zip_code} if geography else {}
     
     def process_representatives(self, representatives: List[Dict]) -> List[Dict]:
         """Process and deduplicate representatives"""
-        # Remove duplicates based on name and title
+        # Remove exact duplicates based on name and title, then near-duplicates
+        # (e.g. "Rep. John Smith" vs "John Smith (D-NY)"); per-ZIP batches are small,
+        # so exact pairwise Jaccard against the kept representatives is cheap
         seen = set()
+        kept_tokens = []
         processed = []
         
         for rep in representatives:
             if not rep or 'name' not in rep or 'title' not in rep:
                 continue
                 
-            key = (rep['name'].lower().strip(), rep['title'].lower().strip())
+            # Interned so repeated names and titles share one string object
+            key = (sys.intern(rep['name'].lower().strip()), sys.intern(rep['title'].lower().strip()))
             
-            if key not in seen:
-                seen.add(key)
-                
+            if key in seen:
+                continue
+            
+            tokens = _name_title_tokens(rep['name'], rep['title'])
+            if any(_jaccard(tokens, other) >= NEAR_DUP_THRESHOLD for other in kept_tokens):
+                self.logger.debug(f"Skipping near-duplicate representative: {rep['name']}")
+                continue
+            
+            seen.add(key)
+            kept_tokens.append(tokens)
+            
+            # Records tagged as canonical only need copying, without the tag, for storage
+            if rep.get(NORMALIZED_TAG):
+                processed_rep = {key: value for key, value in rep.items() if key != NORMALIZED_TAG}
+            else:
                 # Ensure all required fields are present
                 processed_rep = self.normalize_representative_data(rep)
-                processed.append(processed_rep)
+            processed.append(processed_rep)
         
         return processed
     
     def normalize_representative_data(self, rep: Dict) -> Dict:
         """Normalize representative data to ensure consistency"""
-        normalized = {
-            'name': rep.get('name', '').strip(),
-            'title': rep.get('title', '').strip(),
-            'party': rep.get('party', '').strip(),
-            'branch': rep.get('branch', 'federal').lower(),
-            'office_type': rep.get('office_type', '').strip(),
-            'phone': rep.get('phone', '').strip(),
-            'email': rep.get('email', '').strip(),
-            'website': rep.get('website', '').strip(),
-            'photo_url': rep.get('photo_url', '').strip(),
-            'address_line1': rep.get('address_line1', '').strip(),
-            'address_line2': rep.get('address_line2', '').strip(),
-            'address_city': rep.get('address_city', '').strip(),
-            'address_state': rep.get('address_state', '').strip(),
-            'address_zip': rep.get('address_zip', '').strip(),
-            'term_start': rep.get('term_start'),
-            'term_end': rep.get('term_end'),
-            'is_active': rep.get('is_active', True)
-        }
-        
-        # Convert empty strings to None for database storage
-        for key, value in normalized.items():
-            if isinstance(value, str) and not value:
-                normalized[key] = None
-        
-        return normalized
+        return _normalize_rep(rep)
     
-    def store_data(self, results: Dict):
+    def store_data(self, results: ZipResult):
         """Store scraped data in the database"""
-        scraper = self.scrapers['house']  # Use any scraper for database access
+        self.store_data_bulk([results])
+    
+    def store_data_bulk(self, all_results: List[ZipResult]):
+        """Store many ZIP codes' data as one transaction: one statement per table"""
+        scraper = self._get_scraper('house')  # Use any scraper for database access
         
-        try:
-            # Insert geography data
-            geo_id = scraper.insert_geography(results['geography'])
-            
-            # Insert representatives and create mappings
-            for rep_data in results['representatives']:
-                rep_id = scraper.insert_representative(rep_data)
-                scraper.create_geography_mapping(
-                    rep_id, 
-                    geo_id, 
-                    rep_data['branch']
+        # Workers share the scraper's connection and cursor, so writes are serialized
+        with self.db_lock:
+            try:
+                geo_ids = scraper.bulk_upsert_geography([r.geography for r in all_results])
+                
+                # Senators and governors repeat across ZIP codes; upsert each once
+                unique_reps = {
+                    (rep['name'], rep['title']): rep
+                    for results in all_results for rep in results.representatives
+                }
+                rep_ids = dict(zip(unique_reps, scraper.bulk_upsert_representatives(list(unique_reps.values()))))
+                
+                scraper.bulk_create_geography_mappings(
+                    (rep_ids[(rep['name'], rep['title'])], geo_ids[results.zip_code], rep['branch'])
+                    for results in all_results for rep in results.representatives
                 )
-            
-            self.logger.info(f"Successfully stored data for ZIP {results['zip_code']}")
-            
+                
+                scraper.flush()
+                self.logger.info(f"Successfully stored data for {len(all_results)} ZIP codes")
+                
+            except Exception as e:
+                scraper.rollback()
+                self.logger.error(f"Error storing data: {e}")
+                raise
+    
+    def flush_results(self, pending: List[ZipResult], on_result: Callable[[ZipResult], None] = None):
+        """Store buffered ZIP results, marking them failed if the transaction fails"""
+        if not pending:
+            return
+        
+        try:
+            self.store_data_bulk(pending)
         except Exception as e:
-            self.logger.error(f"Error storing data: {e}")
-            raise
+            for results in pending:
+                results.success = False
+                results.errors.append(f"Error storing data: {e}")
+        
+        if on_result:
+            for results in pending:
+                on_result(results)
+        
+        pending.clear()
+    
+    def load_geography_csv(self, path: str) -> int:
+        """Bulk load a ZIP code geography CSV into the database"""
+        scraper = self._get_scraper('house')  # Use any scraper for database access
+        return scraper.bulk_load_geography_csv(path)
     
     def validate_zip_code(self, zip_code: str) -> bool:
-        """Validate ZIP code format"""
-        import re
-        return bool(re.match(r'^\d{5}$', zip_code))
+        """Validate ZIP code format (exactly five ASCII digits)"""
+        return len(zip_code) == 5 and zip_code.isascii() and zip_code.isdigit()
     
-    def process_multiple_zip_codes(self, zip_codes: List[str]) -> List[Dict]:
-        """Process multiple ZIP codes"""
+    def process_multiple_zip_codes(self, zip_codes: Iterable[str],
+                                   on_result: Callable[[ZipResult], None] = None) -> List[ZipResult]:
+        """Process multiple ZIP codes concurrently, reading the input lazily"""
+        # Results go to on_result once final (stored or failed); without a callback they are returned
         results = []
+        emit = on_result or results.append
+        pending = []
+        in_flight = {}
         
-        for i, zip_code in enumerate(zip_codes):
-            self.logger.info(f"Processing {i+1}/{len(zip_codes)}: {zip_code}")
-            
-            try:
-                result = self.process_zip_code(zip_code)
-                results.append(result)
+        self.warm_up_scrapers()
+        
+        # HTTP requests are paced by self.rate_limiter
+        with ThreadPoolExecutor(max_workers=PARALLEL_WORKERS) as executor:
+            for i, zip_code in enumerate(zip_codes):
+                # Bound in-flight work so large inputs are not read ahead
+                if len(in_flight) >= PARALLEL_WORKERS * 2:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._collect_result(future, in_flight.pop(future), pending, emit)
                 
-                # Add delay between ZIP codes to be respectful
-                if i < len(zip_codes) - 1:  # Don't sleep after the last one
-                    import time
-                    time.sleep(3)
-                    
-            except Exception as e:
-                self.logger.error(f"Failed to process ZIP code {zip_code}: {e}")
-                results.append({
-                    'zip_code': zip_code,
-                    'success': False,
-                    'errors': [str(e)]
-                })
+                self.logger.info(f"Processing #{i+1}: {zip_code}")
+                in_flight[executor.submit(self.process_zip_code, zip_code, store=False)] = zip_code
+            
+            for future in as_completed(in_flight):
+                self._collect_result(future, in_flight[future], pending, emit)
+        
+        self.flush_results(pending, emit)
+        return results
+    
+    def _collect_result(self, future: Future, zip_code: str, pending: List[ZipResult],
+                        emit: Callable[[ZipResult], None]):
+        """Handle a finished ZIP code, storing successes once enough have accumulated"""
+        try:
+            result = future.result()
+        except Exception as e:
+            self.logger.error(f"Failed to process ZIP code {zip_code}: {e}")
+            emit(ZipResult(zip_code, errors=[str(e)]))
+            return
+        
+        if not result.success:
+            emit(result)
+            return
         
+        # Commit every flush_every ZIP codes rather than once per ZIP
+        pending.append(result)
+        if len(pending) >= self.flush_every:
+            self.flush_results(pending, emit)
+    
+    def process_multiple_zip_codes_async(self, zip_codes: Iterable[str],
+                                         on_result: Callable[[ZipResult], None] = None) -> List[ZipResult]:
+        """Process multiple ZIP codes on an asyncio event loop"""
+        # Results go to on_result once final (stored or failed); without a callback they are returned
+        results = []
+        asyncio.run(self._run_all(zip_codes, on_result or results.append))
         return results
     
+    async def _run_all(self, zip_codes: Iterable[str], emit: Callable[[ZipResult], None]):
+        """Process ZIP codes concurrently, sharing one HTTP client across all scrapers"""
+        loop = asyncio.get_running_loop()
+        zip_iter = iter(zip_codes)
+        pending = []
+        
+        async def worker():
+            # Workers pull from one shared iterator, so input is read only as fast as it is processed
+            for zip_code in zip_iter:
+                try:
+                    result = await self.process_zip_code_async(zip_code, store=False)
+                except Exception as e:
+                    self.logger.error(f"Failed to process ZIP code {zip_code}: {e}")
+                    result = ZipResult(zip_code, errors=[str(e)])
+                
+                if not result.success:
+                    emit(result)
+                    continue
+                
+                # Commit every flush_every ZIP codes as results arrive
+                pending.append(result)
+                if len(pending) >= self.flush_every:
+                    await flush()
+        
+        async def flush():
+            # Hand the buffered batch to a worker thread so the loop keeps scraping
+            batch = pending[:]
+            pending.clear()
+            await loop.run_in_executor(None, self.flush_results, batch, emit)
+        
+        async with httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=ASYNC_MAX_CONNECTIONS),
+            timeout=REQUEST_TIMEOUT,
+            http2=True,
+            follow_redirects=True
+        ) as client:
+            # Creating scrapers and loading their reference data block, so do both in a
+            # thread before any task runs on the loop
+            await loop.run_in_executor(None, self.warm_up_scrapers)
+            
+            for name in SCRAPER_CLASSES:
+                self._get_scraper(name).set_async_client(client)
+            
+            try:
+                await asyncio.gather(*(worker() for _ in range(ASYNC_CONCURRENCY)))
+            finally:
+                for scraper in self.scrapers.values():
+                    scraper.set_async_client(None)
+        
+        await flush()
+    
     def cleanup(self):
-        """Clean up resources"""
+        """Clean up resources held by the scrapers created so far"""
+        if self._scraper_executor:
+            self._scraper_executor.shutdown()
         for scraper in self.scrapers.values():
             scraper.close_connection()
+        db_pool.closeall()
 
-def main():
-    """Main entry point"""
+def positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+# Option defaults shared by build_parser() and the parse_args() fast path
+DEFAULT_ARGS = {
+    'zip': None, 'zip_file': None, 'geography_csv': None, 'demo': False,
+    'use_async': False, 'flush_every': FLUSH_EVERY, 'out': None, 'verbose': False,
+}
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command line parser for the scraper"""
     parser = argparse.ArgumentParser(description='Scrape political representative data')
     parser.add_argument('--zip', '-z', help='Single ZIP code to process')
     parser.add_argument('--zip-file', '-f', help='File containing ZIP codes (one per line)')
+    parser.add_argument('--geography-csv', '-g', help='CSV of ZIP code geography data to bulk load')
     parser.add_argument('--demo', '-d', action='store_true', help='Run demo with sample ZIP codes')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Process multiple ZIP codes on an asyncio event loop')
+    parser.add_argument('--flush-every', type=positive_int,
+                        help=f'Commit stored data every N ZIP codes (default: {FLUSH_EVERY})')
+    parser.add_argument('--out', '-o', help='Write per-ZIP results to this file as NDJSON')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
+    parser.set_defaults(**DEFAULT_ARGS)
+    return parser
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse arguments, skipping argparse for the common single-option invocations"""
+    args = argparse.Namespace(**DEFAULT_ARGS)
+    
+    if len(argv) == 1 and argv[0] in ('--demo', '-d'):
+        args.demo = True
+    elif len(argv) == 2 and argv[0] in ('--zip', '-z') and not argv[1].startswith('-'):
+        args.zip = argv[1]
+    elif len(argv) == 2 and argv[0] in ('--zip-file', '-f') and not argv[1].startswith('-'):
+        args.zip_file = argv[1]
+    else:
+        # Anything else, including --help and malformed input, goes through argparse
+        args = build_parser().parse_args(argv)
     
-    args = parser.parse_args()
+    return args
+
+def main():
+    """Main entry point"""
+    args = parse_args(sys.argv[1:])
     
     # Configure logging
     log_level = logging.DEBUG if args.verbose else logging.INFO
@@ -251,55 +559,63 @@ def main():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
-    processor = RepresentativeDataProcessor()
+    processor = RepresentativeDataProcessor(flush_every=args.flush_every)
+    process_many = (processor.process_multiple_zip_codes_async if args.use_async
+                    else processor.process_multiple_zip_codes)
+    out = None
     
     try:
+        # Results are streamed to --out as each ZIP code finishes; only counts are kept
+        if args.out:
+            out = open(args.out, 'w')
+        writer = ResultWriter(out)
+        
+        if args.geography_csv:
+            # Bulk load reference geography before any scraping
+            try:
+                print(f"Loading geography data from {args.geography_csv}")
+                loaded = processor.load_geography_csv(args.geography_csv)
+                print(f"Loaded {loaded} geography records")
+            except FileNotFoundError:
+                print(f"Error: File {args.geography_csv} not found")
+                return 1
+            
+            if not (args.demo or args.zip or args.zip_file):
+                return 0
+        
         if args.demo:
             # Demo mode with sample ZIP codes
             demo_zips = ['11354', '20301', '90210']
             print(f"Running demo with ZIP codes: {demo_zips}")
-            results = processor.process_multiple_zip_codes(demo_zips)
+            process_many(demo_zips, writer.write)
             
         elif args.zip:
             # Single ZIP code mode
             print(f"Processing ZIP code: {args.zip}")
-            result = processor.process_zip_code(args.zip)
-            results = [result]
+            writer.write(processor.process_zip_code(args.zip))
             
         elif args.zip_file:
             # File mode
             try:
-                with open(args.zip_file, 'r') as f:
-                    zip_codes = [line.strip() for line in f if line.strip()]
-                print(f"Processing {len(zip_codes)} ZIP codes from file")
-                results = processor.process_multiple_zip_codes(zip_codes)
+                print(f"Processing ZIP codes from {args.zip_file}")
+                process_many(iter_zip_codes(args.zip_file), writer.write)
             except FileNotFoundError:
                 print(f"Error: File {args.zip_file} not found")
                 return 1
                 
         else:
             # No arguments provided
-            parser.print_help()
+            build_parser().print_help()
             return 1
         
         # Print summary
-        successful = sum(1 for r in results if r.get('success', False))
-        total = len(results)
-        
         print(f"\nScraping completed:")
-        print(f"  Total ZIP codes processed: {total}")
-        print(f"  Successful: {successful}")
-        print(f"  Failed: {total - successful}")
-        
-        if args.verbose:
-            for result in results:
-                status = "✓" if result.get('success', False) else "✗"
-                rep_count = len(result.get('representatives', []))
-                print(f"  {status} {result['zip_code']}: {rep_count} representatives")
-                
-                if result.get('errors'):
-                    for error in result['errors']:
-                        print(f"    Error: {error}")
+        print(f"  Total ZIP codes processed: {writer.total}")
+        print(f"  Successful: {writer.successful}")
+        print(f"  Failed: {writer.total - writer.successful}")
+        
+        if args.out:
+            print(f"  Results written to {args.out}")
         
         return 0
         
@@ -313,6 +629,8 @@ def main():
         return 1
         
     finally:
+        if out:
+            out.close()
         processor.cleanup()
 
 if __name__ == '__main__':
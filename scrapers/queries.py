@@ -0,0 +1,166 @@
+"""
+SQL statements used by the scrapers, defined once at import
+"""
+
+# Single-row geography upsert
+INSERT_GEOGRAPHY_SQL = """
+    INSERT INTO geography (
+        zip_code, city, state, state_name, county, 
+        congressional_district, latitude, longitude
+    ) VALUES (
+        %(zip_code)s, %(city)s, %(state)s, %(state_name)s, 
+        %(county)s, %(congressional_district)s, %(latitude)s, %(longitude)s
+    )
+    ON CONFLICT (zip_code) DO UPDATE SET
+        city = EXCLUDED.city,
+        state = EXCLUDED.state,
+        state_name = EXCLUDED.state_name,
+        county = EXCLUDED.county,
+        congressional_district = EXCLUDED.congressional_district,
+        latitude = EXCLUDED.latitude,
+        longitude = EXCLUDED.longitude,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING id
+"""
+
+# Multi-row geography upsert for execute_values
+UPSERT_GEOGRAPHIES_SQL = """
+    INSERT INTO geography (
+        zip_code, city, state, state_name, county, 
+        congressional_district, latitude, longitude
+    ) VALUES %s
+    ON CONFLICT (zip_code) DO UPDATE SET
+        city = EXCLUDED.city,
+        state = EXCLUDED.state,
+        state_name = EXCLUDED.state_name,
+        county = EXCLUDED.county,
+        congressional_district = EXCLUDED.congressional_district,
+        latitude = EXCLUDED.latitude,
+        longitude = EXCLUDED.longitude,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING id, zip_code
+"""
+
+# Row template for UPSERT_GEOGRAPHIES_SQL
+UPSERT_GEOGRAPHIES_TEMPLATE = """(
+    %(zip_code)s, %(city)s, %(state)s, %(state_name)s, 
+    %(county)s, %(congressional_district)s, %(latitude)s, %(longitude)s
+)"""
+
+# Empty the COPY staging table before and after a load
+TRUNCATE_GEOGRAPHY_STAGING_SQL = "TRUNCATE geography_staging"
+
+# CSV COPY into the staging table; column order matches GEOGRAPHY_COLUMNS
+COPY_GEOGRAPHY_STAGING_SQL = """
+    COPY geography_staging (
+        zip_code, city, state, state_name, county,
+        congressional_district, latitude, longitude
+    ) FROM STDIN WITH CSV
+"""
+
+# Merge of the COPY staging table into geography
+MERGE_GEOGRAPHY_STAGING_SQL = """
+    INSERT INTO geography (
+        zip_code, city, state, state_name, county, 
+        congressional_district, latitude, longitude
+    )
+    SELECT DISTINCT ON (zip_code)
+        zip_code, city, state, state_name, county,
+        congressional_district, latitude::DECIMAL, longitude::DECIMAL
+    FROM geography_staging
+    ORDER BY zip_code
+    ON CONFLICT (zip_code) DO UPDATE SET
+        city = EXCLUDED.city,
+        state = EXCLUDED.state,
+        state_name = EXCLUDED.state_name,
+        county = EXCLUDED.county,
+        congressional_district = EXCLUDED.congressional_district,
+        latitude = EXCLUDED.latitude,
+        longitude = EXCLUDED.longitude,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# Single-row representative upsert
+UPSERT_REPRESENTATIVE_SQL = """
+    INSERT INTO representatives (
+        name, title, party, branch, office_type, phone, email, 
+        website, photo_url, address_line1, address_line2, 
+        address_city, address_state, address_zip, term_start, 
+        term_end, is_active
+    ) VALUES (
+        %(name)s, %(title)s, %(party)s, %(branch)s, %(office_type)s, 
+        %(phone)s, %(email)s, %(website)s, %(photo_url)s, 
+        %(address_line1)s, %(address_line2)s, %(address_city)s, 
+        %(address_state)s, %(address_zip)s, %(term_start)s, 
+        %(term_end)s, %(is_active)s
+    )
+    ON CONFLICT (name, title) DO UPDATE SET
+        party = EXCLUDED.party,
+        branch = EXCLUDED.branch,
+        office_type = EXCLUDED.office_type,
+        phone = EXCLUDED.phone,
+        email = EXCLUDED.email,
+        website = EXCLUDED.website,
+        photo_url = EXCLUDED.photo_url,
+        address_line1 = EXCLUDED.address_line1,
+        address_line2 = EXCLUDED.address_line2,
+        address_city = EXCLUDED.address_city,
+        address_state = EXCLUDED.address_state,
+        address_zip = EXCLUDED.address_zip,
+        term_start = EXCLUDED.term_start,
+        term_end = EXCLUDED.term_end,
+        is_active = EXCLUDED.is_active,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING id
+"""
+
+# Multi-row representative upsert for execute_values
+UPSERT_REPRESENTATIVES_SQL = """
+    INSERT INTO representatives (
+        name, title, party, branch, office_type, phone, email, 
+        website, photo_url, address_line1, address_line2, 
+        address_city, address_state, address_zip, term_start, 
+        term_end, is_active
+    ) VALUES %s
+    ON CONFLICT (name, title) DO UPDATE SET
+        party = EXCLUDED.party,
+        branch = EXCLUDED.branch,
+        office_type = EXCLUDED.office_type,
+        phone = EXCLUDED.phone,
+        email = EXCLUDED.email,
+        website = EXCLUDED.website,
+        photo_url = EXCLUDED.photo_url,
+        address_line1 = EXCLUDED.address_line1,
+        address_line2 = EXCLUDED.address_line2,
+        address_city = EXCLUDED.address_city,
+        address_state = EXCLUDED.address_state,
+        address_zip = EXCLUDED.address_zip,
+        term_start = EXCLUDED.term_start,
+        term_end = EXCLUDED.term_end,
+        is_active = EXCLUDED.is_active,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING id, name, title
+"""
+
+# Representative-to-geography mapping upsert
+INSERT_GEOGRAPHY_MAPPING_SQL = """
+    INSERT INTO rep_geography_map (
+        representative_id, geography_id, jurisdiction_level
+    ) VALUES (%s, %s, %s)
+    ON CONFLICT (representative_id, geography_id) DO UPDATE SET
+        jurisdiction_level = EXCLUDED.jurisdiction_level
+"""
+
+# Multi-row mapping upsert for execute_values
+INSERT_GEOGRAPHY_MAPPINGS_SQL = """
+    INSERT INTO rep_geography_map (
+        representative_id, geography_id, jurisdiction_level
+    ) VALUES %s
+    ON CONFLICT (representative_id, geography_id) DO UPDATE SET
+        jurisdiction_level = EXCLUDED.jurisdiction_level
+"""
+
+# ZIP-to-state lookup table for the House scraper
+SELECT_ZIP_STATES_SQL = """
+    SELECT zip_code, state FROM geography
+"""
@@ -0,0 +1,251 @@
+"""
+Static reference data for demo ZIP codes, built once at import and exposed read-only
+"""
+
+from types import MappingProxyType
+
+# Marks records already in the processor's canonical form so normalization can be skipped
+NORMALIZED_TAG = '_normalized'
+
+def _canonical(rep):
+    """Record in normalized form (stripped strings, empty -> None), tagged as such"""
+    canonical = {key: (value.strip() or None) if isinstance(value, str) else value
+                 for key, value in rep.items()}
+    canonical[NORMALIZED_TAG] = True
+    return canonical
+
+def _frozen(records, normalized=False):
+    """Wrap a dict of records (or lists of them) in read-only views"""
+    prepare = _canonical if normalized else dict
+    frozen = {}
+    for key, value in records.items():
+        if isinstance(value, list):
+            frozen[key] = tuple(MappingProxyType(prepare(rep)) for rep in value)
+        else:
+            frozen[key] = MappingProxyType(prepare(value))
+    return MappingProxyType(frozen)
+
+# House representatives keyed by ZIP code
+SAMPLE_HOUSE_REPS = _frozen({
+    '11354': {
+        'name': 'Grace Meng',
+        'title': 'U.S. House Rep, NY-6',
+        'party': 'Democratic',
+        'branch': 'federal',
+        'office_type': 'House Representative',
+        'phone': '(202) 225-2601',
+        'email': '',
+        'website': 'https://meng.house.gov',
+        'photo_url': '',
+        'address_line1': '2209 Rayburn House Office Building',
+        'address_line2': '',
+        'address_city': 'Washington',
+        'address_state': 'DC',
+        'address_zip': '20515',
+        'term_start': None,
+        'term_end': None,
+        'is_active': True,
+        'state': 'NY',
+        'district': '06'
+    },
+    '20301': {
+        'name': 'Eleanor Holmes Norton',
+        'title': 'U.S. House Delegate, DC-At Large',
+        'party': 'Democratic',
+        'branch': 'federal',
+        'office_type': 'House Delegate',
+        'phone': '(202) 225-8050',
+        'email': '',
+        'website': 'https://norton.house.gov',
+        'photo_url': '',
+        'address_line1': '2136 Rayburn House Office Building',
+        'address_line2': '',
+        'address_city': 'Washington',
+        'address_state': 'DC',
+        'address_zip': '20515',
+        'term_start': None,
+        'term_end': None,
+        'is_active': True,
+        'state': 'DC',
+        'district': '00'
+    },
+    '90210': {
+        'name': 'Brad Sherman',
+        'title': 'U.S. House Rep, CA-30',
+        'party': 'Democratic',
+        'branch': 'federal',
+        'office_type': 'House Representative',
+        'phone': '(202) 225-5911',
+        'email': '',
+        'website': 'https://sherman.house.gov',
+        'photo_url': '',
+        'address_line1': '2181 Rayburn House Office Building',
+        'address_line2': '',
+        'address_city': 'Washington',
+        'address_state': 'DC',
+        'address_zip': '20515',
+        'term_start': None,
+        'term_end': None,
+        'is_active': True,
+        'state': 'CA',
+        'district': '30'
+    }
+})
+
+# Senators keyed by state abbreviation; records carry exactly the representative fields
+SENATORS_BY_STATE = _frozen({
+    'NY': [
+        {
+            'name': 'Chuck Schumer',
+            'title': 'U.S. Senator, NY',
+            'party': 'Democratic',
+            'branch': 'federal',
+            'office_type': 'Senator',
+            'phone': '(202) 224-6542',
+            'email': '',
+            'website': 'https://www.schumer.senate.gov',
+            'photo_url': '',
+            'address_line1': '322 Hart Senate Office Building',
+            'address_line2': '',
+            'address_city': 'Washington',
+            'address_state': 'DC',
+            'address_zip': '20510',
+            'term_start': None,
+            'term_end': None,
+            'is_active': True
+        },
+        {
+            'name': 'Kirsten Gillibrand',
+            'title': 'U.S. Senator, NY',
+            'party': 'Democratic',
+            'branch': 'federal',
+            'office_type': 'Senator',
+            'phone': '(202) 224-4451',
+            'email': '',
+            'website': 'https://www.gillibrand.senate.gov',
+            'photo_url': '',
+            'address_line1': '478 Russell Senate Office Building',
+            'address_line2': '',
+            'address_city': 'Washington',
+            'address_state': 'DC',
+            'address_zip': '20510',
+            'term_start': None,
+            'term_end': None,
+            'is_active': True
+        }
+    ],
+    'CA': [
+        {
+            'name': 'Dianne Feinstein',
+            'title': 'U.S. Senator, CA',
+            'party': 'Democratic',
+            'branch': 'federal',
+            'office_type': 'Senator',
+            'phone': '(202) 224-3841',
+            'email': '',
+            'website': 'https://www.feinstein.senate.gov',
+            'photo_url': '',
+            'address_line1': '331 Hart Senate Office Building',
+            'address_line2': '',
+            'address_city': 'Washington',
+            'address_state': 'DC',
+            'address_zip': '20510',
+            'term_start': None,
+            'term_end': None,
+            'is_active': True
+        },
+        {
+            'name': 'Alex Padilla',
+            'title': 'U.S. Senator, CA',
+            'party': 'Democratic',
+            'branch': 'federal',
+            'office_type': 'Senator',
+            'phone': '(202) 224-3553',
+            'email': '',
+            'website': 'https://www.padilla.senate.gov',
+            'photo_url': '',
+            'address_line1': '112 Hart Senate Office Building',
+            'address_line2': '',
+            'address_city': 'Washington',
+            'address_state': 'DC',
+            'address_zip': '20510',
+            'term_start': None,
+            'term_end': None,
+            'is_active': True
+        }
+    ],
+    'DC': []  # DC has no voting senators
+}, normalized=True)
+
+# Governors keyed by state abbreviation; records carry exactly the representative fields
+GOVERNORS_BY_STATE = _frozen({
+    'NY': {
+        'name': 'Kathy Hochul',
+        'title': 'Governor, New York',
+        'party': 'Democratic',
+        'branch': 'state',
+        'office_type': 'Governor',
+        'phone': '(518) 474-8390',
+        'email': '',
+        'website': 'https://www.governor.ny.gov',
+        'photo_url': '',
+        'address_line1': 'NYS State Capitol Building',
+        'address_line2': '',
+        'address_city': 'Albany',
+        'address_state': 'NY',
+        'address_zip': '12224',
+        'term_start': None,
+        'term_end': None,
+        'is_active': True
+    },
+    'CA': {
+        'name': 'Gavin Newsom',
+        'title': 'Governor, California',
+        'party': 'Democratic',
+        'branch': 'state',
+        'office_type': 'Governor',
+        'phone': '(916) 445-2841',
+        'email': '',
+        'website': 'https://www.gov.ca.gov',
+        'photo_url': '',
+        'address_line1': '1303 10th Street, Suite 1173',
+        'address_line2': '',
+        'address_city': 'Sacramento',
+        'address_state': 'CA',
+        'address_zip': '95814',
+        'term_start': None,
+        'term_end': None,
+        'is_active': True
+    }
+}, normalized=True)
+
+# Sample geography data keyed by ZIP code
+GEOGRAPHY_BY_ZIP = _frozen({
+    '11354': {
+        'city': 'Flushing',
+        'state': 'NY',
+        'state_name': 'New York',
+        'county': 'Queens',
+        'congressional_district': '06',
+        'latitude': 40.7598,
+        'longitude': -73.8303
+    },
+    '20301': {
+        'city': 'Washington',
+        'state': 'DC',
+        'state_name': 'District of Columbia',
+        'county': 'District of Columbia',
+        'congressional_district': '00',
+        'latitude': 38.9072,
+        'longitude': -77.0369
+    },
+    '90210': {
+        'city': 'Beverly Hills',
+        'state': 'CA',
+        'state_name': 'California',
+        'county': 'Los Angeles',
+        'congressional_district': '30',
+        'latitude': 34.0901,
+        'longitude': -118.4065
+    }
+})